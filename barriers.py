@@ -1,9 +1,11 @@
 import random
-from typing import Any, ClassVar, FrozenSet, Generator, Iterable, Set, Tuple
+from functools import cached_property
+from typing import Any, ClassVar, FrozenSet, Iterable, Iterator, Tuple
 
 import attr
 
 from space import Area, Point
+from tree import SpaceTree
 
 
 @attr.s(auto_attribs=True, frozen=True)
@@ -37,15 +39,20 @@ class Barriers:
         return Barriers(areas=frozenset(areas), points=points)
 
     @property
-    def positions(self) -> Generator[Tuple[Point, BarrierPoint], None, None]:
-        for point in self.points:
-            bp = BarrierPoint(
-                above=self.occupied(Point(point.x, point.y - 1)),
-                below=self.occupied(Point(point.x, point.y + 1)),
-                left=self.occupied(Point(point.x - 1, point.y)),
-                right=self.occupied(Point(point.x + 1, point.y)),
-            )
-            yield (point, bp)
+    def positions(self) -> Iterator[Tuple[Point, BarrierPoint]]:
+        return iter(self._positions)
+
+    @cached_property
+    def _positions(self) -> Tuple[Tuple[Point, BarrierPoint], ...]:
+        return _barrier_positions(self.points)
+
+    @cached_property
+    def _index(self) -> SpaceTree[bool]:
+        # Only queries over large areas need the index, so it's built the first time
+        # one comes along rather than for every set of barriers
+        return SpaceTree.build(
+            _bounds(self.points), {point: True for point in self.points}
+        )
 
     def __bool__(self) -> bool:
         return bool(self.areas)
@@ -53,34 +60,71 @@ class Barriers:
     def occupied(self, point: Point) -> bool:
         return point in self.points
 
-    def occupied_points_in(self, area: Area) -> Set[Point]:
-        barrier_points = set()
-        for barrier in self.areas:
-            barrier_points |= {point for point in barrier.intersect(area)}
-        return barrier_points
+    def occupied_points_in(self, area: Area) -> FrozenSet[Point]:
+        # Small areas (such as a character's range of movement) are cheaper to check
+        # cell by cell; anything larger goes through the spatial index
+        if area.width * area.height < len(self.points):
+            return self.points.intersection(area)
+        else:
+            return frozenset(self._index.points_in(area))
+
+
+def _barrier_positions(
+    points: FrozenSet[Point],
+) -> Tuple[Tuple[Point, BarrierPoint], ...]:
+    """Work out how each barrier point joins up with its neighbours.
+
+    Barriers never change once they're built, so this only needs doing once, rather
+    than every time the world gets drawn.
+    """
+    return tuple(
+        (
+            point,
+            BarrierPoint(
+                above=Point(point.x, point.y - 1) in points,
+                below=Point(point.x, point.y + 1) in points,
+                left=Point(point.x - 1, point.y) in points,
+                right=Point(point.x + 1, point.y) in points,
+            ),
+        )
+        for point in points
+    )
+
+
+def _bounds(points: Iterable[Point]) -> Area:
+    """Return the smallest area containing all the given points."""
+    points = list(points)
+    if not points:
+        return Area.from_zero(0, 0)
+    lower = Point(min(p.x for p in points), min(p.y for p in points))
+    upper = Point(max(p.x for p in points) + 1, max(p.y for p in points) + 1)
+    return Area(lower, upper)
 
 
 Barriers.NONE = Barriers.for_areas([])
 
 
 def random_barriers(counter: Iterable[Any], area: Area) -> Barriers:
-    def x_coord() -> int:
-        return random.randint(area._lower.x, area._upper.x - 1)
+    count = sum(1 for _ in counter)
 
-    def y_coord() -> int:
-        return random.randint(area._lower.y, area._upper.y - 1)
+    # Draw all the co-ordinates we could need in one go, rather than making a call to
+    # random.randint for each one
+    xs = random.choices(range(area._lower.x, area._upper.x), k=2 * count)
+    ys = random.choices(range(area._lower.y, area._upper.y), k=2 * count)
+    # One random bit per barrier for its orientation
+    vertical = random.getrandbits(count) if count else 0
 
     barrier_areas = set()
-    for _ in counter:
-        if random.choice([True, False]):
+    for i in range(count):
+        if vertical >> i & 1:
             # Vertical barrier
-            x1 = x_coord()
+            x1 = xs[2 * i]
             x2 = x1 + 1
-            y1, y2 = sorted([y_coord(), y_coord()])
+            y1, y2 = sorted(ys[2 * i : 2 * i + 2])
         else:
             # Horizontal barrier
-            x1, x2 = sorted([x_coord(), x_coord()])
-            y1 = y_coord()
+            x1, x2 = sorted(xs[2 * i : 2 * i + 2])
+            y1 = ys[2 * i]
             y2 = y1 + 1
 
         barrier_areas.add(Area(Point(x1, y1), Point(x2, y2)))
@@ -1,13 +1,17 @@
-from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
 import math
+from operator import attrgetter
 from typing import (
     Callable,
     ClassVar,
+    Collection,
+    Dict,
+    FrozenSet,
     Generic,
     Iterable,
+    List,
     Optional,
-    Mapping,
     Protocol,
     Set,
     Tuple,
@@ -15,8 +19,6 @@ from typing import (
     Union,
 )
 
-import attr
-
 from space import BoundingBox, Vector
 
 State = Union["Living", "Dead", "Undead"]
@@ -35,7 +37,7 @@ class LifeState(Enum):
 
 
 def shortest(vectors: Iterable[Vector]) -> Vector:
-    return min(vectors, key=lambda v: v.distance)
+    return min(vectors, key=attrgetter("distance_squared"))
 
 
 class Actions(Protocol[ActionType]):
@@ -64,24 +66,33 @@ class SupportsNearestHuman(Protocol):
 
 
 class TargetVectors:
+    __slots__ = ("_viewpoint", "_nearest")
+
     def __init__(self, viewpoint: Viewpoint):
         self._viewpoint = viewpoint
+        self._nearest: Dict[Tuple[Vector, LifeState], Optional[Vector]] = {}
 
     @property
     def nearest_human(self) -> Optional[Vector]:
         return self.nearest_human_to(Vector.ZERO)
 
     def nearest_human_to(self, offset: Vector) -> Optional[Vector]:
-        return self._viewpoint.nearest_to(offset, LifeState.LIVING)
+        return self._nearest_to(offset, LifeState.LIVING)
 
     def nearest_zombie_to(self, offset: Vector) -> Optional[Vector]:
-        return self._viewpoint.nearest_to(offset, LifeState.UNDEAD)
-
-
-@attr.s(auto_attribs=True)
-class MoveOption:
-    move: Vector
-    upper_bound: float
+        return self._nearest_to(offset, LifeState.UNDEAD)
+
+    def _nearest_to(self, offset: Vector, life_state: LifeState) -> Optional[Vector]:
+        # Nothing moves while a character makes up its mind, so there's no need to
+        # search for the same thing twice
+        key = (offset, life_state)
+        try:
+            return self._nearest[key]
+        except KeyError:
+            nearest = self._nearest[key] = self._viewpoint.nearest_to(
+                offset, life_state
+            )
+            return nearest
 
 
 def best_move_upper_bound(
@@ -117,56 +128,99 @@ def best_move_upper_bound(
     This only leaves us running the nearest-enemy function twice, rather than
     25 times for a 5-by-5 square.
     """
-    # Moves that take us further away are good; shorter moves break ties
-    move_key = lambda option: (-option.upper_bound, option.move.distance)
-
-    options = sorted([MoveOption(move, math.inf) for move in moves], key=move_key)
-    if not options:
+    # Each option is an index into these parallel lists, rather than an object of its
+    # own, so the inner loop below only ever deals with plain numbers. We only ever
+    # compare distances, so the upper bounds are all kept as squared distances.
+    move_list = list(moves)
+    move_dxs = [move.dx for move in move_list]
+    move_dys = [move.dy for move in move_list]
+    move_distances = [move.distance_squared for move in move_list]
+    upper_bounds: List[float] = [math.inf] * len(move_list)
+
+    if not move_list:
         raise ValueError("Attempting to choose from no available moves")
 
-    best_option: Optional[MoveOption] = None
+    # Moves that take us further away are good; shorter moves break ties. We only ever
+    # need the single most promising option, so rather than keeping everything sorted
+    # we pick it out while we're going over the options anyway.
+    options = list(range(len(move_list)))
+    candidate = min(options, key=move_distances.__getitem__)
+    candidate_bound = upper_bounds[candidate]
+
+    best_option: Optional[int] = None
 
-    while options:
-        # Either we'll set this as our new best candidate, or we'll discard it. Either
-        # way, it's no longer needed in our options to explore
-        candidate = options.pop(0)
-        nearest = nearest_func(candidate.move)
+    while True:
+        nearest = nearest_func(move_list[candidate])
         if nearest is None:
-            return candidate.move
-        candidate.upper_bound = nearest.distance
-        if best_option is None or candidate.upper_bound > best_option.upper_bound:
+            return move_list[candidate]
+        upper_bounds[candidate] = nearest.distance_squared
+        if upper_bounds[candidate] >= candidate_bound:
+            # We picked this move because no other could do better than its bound, and
+            # it's turned out to reach that bound, so there's no need to look further
+            return move_list[candidate]
+        if best_option is None or upper_bounds[candidate] > upper_bounds[best_option]:
             best_option = candidate
-
-        for option in options:
-            option.upper_bound = min(
-                option.upper_bound, (nearest + (candidate.move - option.move)).distance
-            )
-
-        options = sorted(
-            [o for o in options if o.upper_bound > best_option.upper_bound],
-            key=move_key,
-        )
+        best_bound = upper_bounds[best_option]
+
+        # This works out `(nearest + (candidate_move - option_move)).distance` for each
+        # option, without building three intermediate Vectors every time round, and
+        # drops any option that can no longer beat our best in the same pass
+        offset_dx = nearest.dx + move_dxs[candidate]
+        offset_dy = nearest.dy + move_dys[candidate]
+        remaining = []
+        next_candidate: Optional[int] = None
+        next_bound = best_bound
+        next_distance = 0
+        for i in options:
+            if i == candidate:
+                continue
+            dx = offset_dx - move_dxs[i]
+            dy = offset_dy - move_dys[i]
+            distance_squared = dx * dx + dy * dy
+            if distance_squared < upper_bounds[i]:
+                upper_bounds[i] = distance_squared
+            bound = upper_bounds[i]
+            if bound > best_bound:
+                remaining.append(i)
+                if bound > next_bound or (
+                    bound == next_bound and move_distances[i] < next_distance
+                ):
+                    next_candidate = i
+                    next_bound = bound
+                    next_distance = move_distances[i]
+
+        if next_candidate is None:
+            break
+        options = remaining
+        candidate = next_candidate
+        candidate_bound = next_bound
 
     # We have an earlier check that there are options available, so we've gone
     # around the loop at least once, so we have either broken out and returned,
     # or we've assigned something to `best_option`.
     assert best_option is not None
 
-    return best_option.move
+    return move_list[best_option]
 
 
 class Living:
 
+    __slots__ = ()
+
     life_state = LifeState.LIVING
-    movement_range = BoundingBox.range(2)
+    movement_range: ClassVar[BoundingBox] = BoundingBox.range(2)
     next_state = None
 
     def attack(self, target_vectors: TargetVectors) -> Optional[Vector]:
         return None
 
     def best_move(
-        self, target_vectors: TargetVectors, available_moves: Iterable[Vector]
+        self, target_vectors: TargetVectors, available_moves: Collection[Vector]
     ) -> Vector:
+        # It's tempting to find the nearest zombie once and shift it by each move, but
+        # that's only right for moves straight away from it: a move that gets away from
+        # one zombie can bring another closer. We leave it to the upper-bound search to
+        # keep the number of lookups down, which tends to be two or three per call.
         def nearest_zombie(move: Vector) -> Optional[Vector]:
             if (nearest := target_vectors.nearest_zombie_to(move)) is not None:
                 return nearest - move
@@ -177,19 +231,24 @@ class Living:
 
 
 class Dead:
+    __slots__ = ("_age",)
+
     def __init__(self, age: int = 0):
         self._age = age
 
     life_state = LifeState.DEAD
-    movement_range = BoundingBox.range(0)
+    movement_range: ClassVar[BoundingBox] = BoundingBox.range(0)
 
     _resurrection_age: ClassVar[int] = 20
 
+    # Dead states don't change, so we only need one for each age
+    _by_age: ClassVar[Tuple["Dead", ...]]
+
     def attack(self, target_vectors: TargetVectors) -> Optional[Vector]:
         return None
 
     def best_move(
-        self, target_vectors: TargetVectors, available_moves: Iterable[Vector]
+        self, target_vectors: TargetVectors, available_moves: Collection[Vector]
     ) -> Vector:
         if Vector.ZERO not in available_moves:
             raise ValueError("Zero move unavailable for dead character")
@@ -200,37 +259,54 @@ class Dead:
         if self._age >= self._resurrection_age:
             return Undead()
         else:
-            return Dead(self._age + 1)
+            return self._by_age[self._age + 1]
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, Dead) and self._age == other._age
 
 
+Dead._by_age = tuple(Dead(age) for age in range(Dead._resurrection_age + 1))
+
+
 class Undead:
 
+    __slots__ = ()
+
     life_state = LifeState.UNDEAD
-    movement_range = BoundingBox.range(1)
-    attack_range = BoundingBox.range(1)
+    movement_range: ClassVar[BoundingBox] = BoundingBox.range(1)
+    attack_range: ClassVar[BoundingBox] = BoundingBox.range(1)
     next_state = None
 
+    # Looking a vector up in a frozenset of the offsets in range only needs its cached
+    # co-ordinate hash and an identity check, which is cheaper than comparing against
+    # the edges of the box
+    _attack_offsets: ClassVar[FrozenSet[Vector]] = frozenset(attack_range)
+
     def attack(self, target_vectors: SupportsNearestHuman) -> Optional[Vector]:
         nearest_human = target_vectors.nearest_human
-        if nearest_human is not None and nearest_human in self.attack_range:
+        if nearest_human is not None and nearest_human in self._attack_offsets:
             return nearest_human
         else:
             return None
 
     def best_move(
-        self, target_vectors: SupportsNearestHuman, available_moves: Iterable[Vector]
+        self, target_vectors: SupportsNearestHuman, available_moves: Collection[Vector]
     ) -> Vector:
         nearest_human = target_vectors.nearest_human
         if nearest_human:
+            # Rank each move by `(nearest_human - move).distance_squared`, working it
+            # out from the co-ordinates rather than building a Vector for every move
+            target_dx, target_dy = nearest_human.dx, nearest_human.dy
 
-            def move_rank(move: Vector) -> Tuple[float, float]:
-                assert nearest_human is not None
-                return ((nearest_human - move).distance, move.distance)
+            def move_rank(move: Vector) -> Tuple[int, int]:
+                dx = target_dx - move.dx
+                dy = target_dy - move.dy
+                return (dx * dx + dy * dy, move.distance_squared)
 
             return min(available_moves, key=move_rank)
+        elif Vector.ZERO in available_moves:
+            # Standing still is always the shortest move, and it's almost always free
+            return Vector.ZERO
         else:
             return shortest(available_moves)
 
@@ -239,6 +315,8 @@ class Undead:
 
 
 class Character:
+    __slots__ = ("_state",)
+
     def __init__(self, state: State):
         self._state = state
 
@@ -255,11 +333,15 @@ class Character:
         new_state = self._state.next_state
         if new_state:
             return actions.change_state(new_state)
-        target_vector = self.attack(environment)
+
+        # Share one set of target vectors between attacking and moving, so anything
+        # looked up while deciding whether to attack doesn't get searched for again
+        target_vectors = TargetVectors(environment)
+        target_vector = self._state.attack(target_vectors)
         if target_vector:
             return actions.attack(target_vector)
-        move = self.move(environment, limits)
-        return actions.move(move)
+        moves = self._available_moves(limits, environment)
+        return actions.move(self._state.best_move(target_vectors, moves))
 
     def move(self, environment: Viewpoint, limits: BoundingBox) -> Vector:
         """Choose where to move next.
@@ -283,10 +365,12 @@ class Character:
 
     def _available_moves(
         self, limits: BoundingBox, environment: Viewpoint
-    ) -> Iterable[Vector]:
+    ) -> Collection[Vector]:
         character_range = self._state.movement_range.intersect(limits)
-        obstacles = environment.occupied_points_in(character_range) - {Vector.ZERO}
-        return available_moves(character_range, obstacles)
+        # Our own position shows up as occupied, but the move grid always starts from
+        # there anyway, so there's no need for a copy of the obstacles without it
+        obstacles = environment.occupied_points_in(character_range)
+        return _move_grid(character_range).available_moves(obstacles)
 
     def attack(self, environment: Viewpoint) -> Optional[Vector]:
         return self._state.attack(TargetVectors(environment))
@@ -295,7 +379,7 @@ class Character:
         return Character(state=new_state)
 
     def attacked(self) -> "Character":
-        return self.with_state(Dead())
+        return self.with_state(Dead._by_age[0])
 
 
 def default_human() -> Character:
@@ -307,34 +391,91 @@ def default_zombie() -> Character:
 
 
 def available_moves(
-    character_range: Iterable[Vector],
+    character_range: BoundingBox,
     obstacles: Set[Vector],
-) -> Set[Vector]:
+) -> FrozenSet[Vector]:
     """Determine available moves for a character.
 
     This function checks not only that the target spaces are empty, but that there's a
     path that allows the character to reach them by passing only through empty spaces.
     """
-    if Vector.ZERO not in character_range or Vector.ZERO in obstacles:
+    if Vector.ZERO in obstacles:
         raise ValueError("Zero movement unavailable for character")
 
-    def max_offset(move: Vector) -> int:
-        return max(abs(move.dx), abs(move.dy))
+    return _move_grid(character_range).available_moves(obstacles)
+
+
+class MoveGrid:
+    """A layout of a character's range of movement as bits in an integer.
+
+    Each move gets a bit of its own, laid out in rows like the grid it came from. This
+    means a whole set of moves can be stored as a single int, and every move adjacent
+    to any of them can be found with a handful of shifts and ORs, rather than checking
+    moves against each other one pair at a time.
 
-    def reachable(a: Vector, b: Vector) -> bool:
-        return abs(a.dx - b.dx) <= 1 and abs(a.dy - b.dy) <= 1
+    Each row has one more bit than it needs, which is never set. This keeps a shift to
+    the left or right from carrying a bit off the end of one row and onto the next.
+    """
 
-    moves_by_offset: Mapping[int, Set[Vector]] = defaultdict(set)
-    for move in character_range:
-        moves_by_offset[max_offset(move)].add(move)
+    def __init__(self, character_range: Iterable[Vector]):
+        moves = list(character_range)
+        radius = max((self._offset(move) for move in moves), default=0)
 
-    available_moves = {Vector.ZERO}
-    for offset in range(1, max(moves_by_offset.keys()) + 1):
-        available_moves |= {
-            outer_move
-            for outer_move in moves_by_offset[offset]
-            if outer_move not in obstacles
-            and any(reachable(outer_move, inner_move) for inner_move in available_moves)
+        self._stride = 2 * radius + 2
+        self._bits = {
+            move: 1 << ((move.dx + radius) + (move.dy + radius) * self._stride)
+            for move in moves
         }
+        self._moves = {bit: move for move, bit in self._bits.items()}
+
+        # Bitmaps of the moves at each distance from the centre
+        self._rings = [0] * (radius + 1)
+        for move, bit in self._bits.items():
+            self._rings[self._offset(move)] |= bit
+
+        # Most characters have few (if any) obstacles nearby, so the same layouts of
+        # blocked moves come up again and again
+        self._reachable = lru_cache(maxsize=4096)(self._find_reachable)
+
+    @staticmethod
+    def _offset(move: Vector) -> int:
+        return max(abs(move.dx), abs(move.dy))
+
+    def __contains__(self, move: Vector) -> bool:
+        return move in self._bits
 
-    return available_moves
+    def available_moves(self, obstacles: Iterable[Vector]) -> FrozenSet[Vector]:
+        """Find the moves reachable from the centre without passing an obstacle.
+
+        The centre itself is always available, even if it's listed as an obstacle, but
+        it has to be somewhere in the grid.
+        """
+        if Vector.ZERO not in self:
+            raise ValueError("Zero movement unavailable for character")
+
+        blocked = 0
+        for obstacle in obstacles:
+            blocked |= self._bits.get(obstacle, 0)
+        return self._reachable(blocked)
+
+    def _find_reachable(self, blocked: int) -> FrozenSet[Vector]:
+        # Work outwards a ring at a time, adding any unblocked moves next to one we
+        # already know we can reach
+        stride = self._stride
+        available = self._bits[Vector.ZERO]
+        for ring in self._rings[1:]:
+            reachable = available | available << 1 | available >> 1
+            reachable |= reachable << stride | reachable >> stride
+            available |= reachable & ring & ~blocked
+
+        moves = set()
+        while available:
+            lowest_bit = available & -available
+            moves.add(self._moves[lowest_bit])
+            available ^= lowest_bit
+        return frozenset(moves)
+
+
+@lru_cache(maxsize=64)
+def _move_grid(character_range: BoundingBox) -> MoveGrid:
+    return MoveGrid(character_range)
@@ -2,11 +2,10 @@ from contextlib import ExitStack
 from itertools import islice
 from os import environ
 import random
-import re
 import shutil
 import sys
 import time
-from typing import Callable, Iterator, Optional, Protocol, Tuple
+from typing import Callable, Iterator, Optional, Protocol, Sequence, Tuple
 
 from barriers import random_barriers
 from character import Character, default_human, default_zombie
@@ -34,10 +33,10 @@ def get_world_size(
         terminal_size = get_terminal_size()
         return (terminal_size.columns // 2, terminal_size.lines - 1), True
 
-    size_match = re.match(r"(\d+)x(\d+)$", size_string)
+    width, separator, height = size_string.partition("x")
 
-    if size_match:
-        return (int(size_match.group(1)), int(size_match.group(2))), False
+    if separator and width.isdecimal() and height.isdecimal():
+        return (int(width), int(height)), False
 
     raise ValueError(f'Unrecognised format "{size_string}"')
 
@@ -50,6 +49,8 @@ DENSITY = float(environ.get("DENSITY", 0.05))
 ZOMBIE_CHANCE = float(environ.get("ZOMBIE_CHANCE", 0.2))
 BARRIERS = int(environ.get("BARRIERS", 20))
 TICK = float(environ.get("TICK", 0.1))
+TICK_SPIN = float(environ.get("TICK_SPIN", 0))
+RENDER = environ.get("RENDER", "1") != "0"
 
 max_age_str = environ.get("MAX_AGE")
 MAX_AGE = int(max_age_str) if max_age_str else None
@@ -57,8 +58,9 @@ MAX_AGE = int(max_age_str) if max_age_str else None
 
 def each_interval(
     interval: float,
-    current_time: Callable[[], float] = time.time,
+    current_time: Callable[[], float] = time.monotonic,
     sleep: Callable[[float], None] = time.sleep,
+    spin: float = 0,
 ) -> Iterator[None]:
     """Yield at regular intervals.
 
@@ -66,16 +68,37 @@ def each_interval(
     yields. If it has been more than `interval` seconds since the last yielded
     value, it will yield the next one immediately, but will not "race" to catch
     up.
+
+    If `spin` is set, the last `spin` seconds before each value are spent
+    busy-waiting instead of sleeping. This keeps ticks evenly spaced on systems
+    where a sleep can overrun by several milliseconds, at the cost of some CPU.
     """
     while True:
         next_tick = current_time() + interval
         yield
-        sleep_time = max(next_tick - current_time(), 0)
+        sleep_time = max(next_tick - current_time() - spin, 0)
         sleep(sleep_time)
+        if spin:
+            while current_time() < next_tick:
+                pass
+
+
+def redraw(old_lines: Optional[Sequence[str]], new_lines: Sequence[str]) -> str:
+    """Return the terminal output to turn one frame into the next.
 
+    The first frame clears the screen and draws every line. After that, we only
+    redraw the lines that have changed, moving the cursor to each one in turn, and
+    finally leave the cursor below the world.
+    """
+    if old_lines is None or len(old_lines) != len(new_lines):
+        return "\033[H\033[J" + "".join(line + "\n" for line in new_lines)
 
-def clear() -> None:
-    print("\033[H\033[J", end="")
+    changes = "".join(
+        f"\033[{row + 1};1H{new_line}\033[K"
+        for row, (old_line, new_line) in enumerate(zip(old_lines, new_lines))
+        if new_line != old_line
+    )
+    return (changes + f"\033[{len(new_lines) + 1};1H") if changes else ""
 
 
 if __name__ == "__main__":
@@ -91,9 +114,12 @@ if __name__ == "__main__":
 
     builder = Builder(world_area, population, barriers)
     roster = builder.roster
-    renderer = Renderer(roster, barriers, empty=empty)
 
-    ticks = islice(each_interval(TICK), MAX_AGE)
+    # Setting RENDER=0 runs the simulation without drawing anything, or even setting
+    # up a renderer, so that traced runs only measure the simulation itself
+    renderer = Renderer(roster, barriers, empty=empty) if RENDER else None
+
+    ticks = islice(each_interval(TICK, spin=TICK_SPIN), MAX_AGE)
 
     tracing_context = ExitStack()
 
@@ -105,16 +131,23 @@ if __name__ == "__main__":
 
     with tracing_context:
         try:
+            lines: Optional[Sequence[str]] = None
             for _ in ticks:
-                clear()
-                for line in renderer.lines:
-                    print(line)
+                if renderer is not None:
+                    with tracing.span("draw"):
+                        # Write each frame in one go, then flush, rather than leaving
+                        # the terminal to pick up one line at a time
+                        new_lines = list(renderer.lines)
+                        sys.stdout.write(redraw(lines, new_lines))
+                        sys.stdout.flush()
+                        lines = new_lines
 
                 with tracing.span("tick"):
                     old_roster, roster = roster, Tick(roster, barriers).next()
 
                 if old_roster == roster:
                     break
-                renderer = Renderer(roster, barriers, empty=empty)
+                if renderer is not None:
+                    renderer = renderer.with_world(roster)
         except KeyboardInterrupt:
             sys.exit(1)
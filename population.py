@@ -1,10 +1,15 @@
+from bisect import bisect_right
 import random
-from typing import Callable, Generic, Iterable, Iterator, Optional, Tuple, TypeVar
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 CharacterType = TypeVar("CharacterType")
 Factory = Callable[[], Optional[CharacterType]]
 
 
+def _no_character() -> None:
+    return None
+
+
 class Population(Generic[CharacterType]):
     def __init__(
         self,
@@ -13,21 +18,26 @@ class Population(Generic[CharacterType]):
     ):
         self._random = random_source
 
-        self._cumulative_probabilities = []
+        # Kept as two parallel tuples, so the factory for a random value can be found
+        # with a binary search of the thresholds rather than checking them one by one.
+        # The extra factory at the end covers values past the last threshold.
+        thresholds = []
+        factories: List[Factory[CharacterType]] = []
         cumulative_prob = 0.0
         for (prob, factory) in probabilities:
             cumulative_prob += prob
-            self._cumulative_probabilities.append((cumulative_prob, factory))
+            thresholds.append(cumulative_prob)
+            factories.append(factory)
+        factories.append(_no_character)
+
+        self._thresholds = tuple(thresholds)
+        self._factories = tuple(factories)
 
     def __iter__(self) -> Iterator[Optional[CharacterType]]:
         return self
 
     def _factory_for(self, random_value: float) -> Factory[CharacterType]:
-        for (prob, factory) in self._cumulative_probabilities:
-            if prob > random_value:
-                return factory
-        else:
-            return lambda: None
+        return self._factories[bisect_right(self._thresholds, random_value)]
 
     def __next__(self) -> Optional[CharacterType]:
         factory = self._factory_for(self._random())
@@ -1,3 +1,4 @@
+from copy import copy
 from enum import Enum
 
 from barriers import BarrierPoint
@@ -6,6 +7,46 @@ from space import Point
 from typing import Any, Iterable, Optional, Protocol, Tuple
 
 
+_BARRIER_GLYPHS = {
+    BarrierPoint(): "\u2573",
+    BarrierPoint(above=True): "\u2575",
+    BarrierPoint(below=True): "\u2577",
+    BarrierPoint(left=True): "\u2574",
+    BarrierPoint(right=True): "\u2576",
+    BarrierPoint(above=True, below=True): "\u2502",
+    BarrierPoint(above=True, left=True): "\u2518",
+    BarrierPoint(above=True, right=True): "\u2514",
+    BarrierPoint(below=True, left=True): "\u2510",
+    BarrierPoint(below=True, right=True): "\u250C",
+    BarrierPoint(left=True, right=True): "\u2500",
+    BarrierPoint(above=True, below=True, left=True): "\u2524",
+    BarrierPoint(above=True, below=True, right=True): "\u251C",
+    BarrierPoint(above=True, left=True, right=True): "\u2534",
+    BarrierPoint(below=True, left=True, right=True): "\u252C",
+    BarrierPoint(above=True, below=True, left=True, right=True): "\u253C",
+}
+
+
+def _barrier_index(barrier: BarrierPoint) -> int:
+    return barrier.above << 3 | barrier.below << 2 | barrier.left << 1 | barrier.right
+
+
+# The same glyphs, indexed by `_barrier_index`. Looking a glyph up by a small int is
+# several times quicker than hashing a BarrierPoint for the dictionary.
+_BARRIER_GLYPH_TABLE = tuple(
+    glyph
+    for _, glyph in sorted(
+        (_barrier_index(barrier), glyph) for barrier, glyph in _BARRIER_GLYPHS.items()
+    )
+)
+
+_CHARACTER_GLYPHS = {
+    LifeState.LIVING: "\U0001F9D1 ",
+    LifeState.UNDEAD: "\U0001F9DF ",
+    LifeState.DEAD: "\U0001F480 ",
+}
+
+
 class RenderEmpty(Enum):
     """What to render for empty spaces in the world."""
 
@@ -56,47 +97,36 @@ class Renderer:
         empty: RenderEmpty = RenderEmpty.DOT,
     ):
         self._world = world
-        self._barriers: Barriers = barriers or NoBarriers()
         self._empty = empty
 
+        # Barriers never change, so we only need to work out their glyphs once
+        self._barrier_cells = [
+            (position, self._render_barrier(barrier))
+            for position, barrier in (barriers or NoBarriers()).positions
+        ]
+
+    def with_world(self, world: World) -> "Renderer":
+        """Return a renderer for a new state of the world, with the same barriers."""
+        renderer = copy(self)
+        renderer._world = world
+        return renderer
+
     @property
     def lines(self) -> Iterable[str]:
         empty_str = str(self._empty.value) + " "
         all_lines = [[empty_str] * self._world.width for _ in range(self._world.height)]
-        for position, barrier in self._barriers.positions:
-            all_lines[position.y][position.x] = self._render_barrier(barrier)
+        for position, cell in self._barrier_cells:
+            all_lines[position.y][position.x] = cell
         for position, character in self._world.positions:
             all_lines[position.y][position.x] = self._render_character(character)
         return ["".join(line) for line in all_lines]
 
     def _render_barrier(self, barrier: BarrierPoint) -> str:
-        barrier_glyphs = {
-            BarrierPoint(): "\u2573",
-            BarrierPoint(above=True): "\u2575",
-            BarrierPoint(below=True): "\u2577",
-            BarrierPoint(left=True): "\u2574",
-            BarrierPoint(right=True): "\u2576",
-            BarrierPoint(above=True, below=True): "\u2502",
-            BarrierPoint(above=True, left=True): "\u2518",
-            BarrierPoint(above=True, right=True): "\u2514",
-            BarrierPoint(below=True, left=True): "\u2510",
-            BarrierPoint(below=True, right=True): "\u250C",
-            BarrierPoint(left=True, right=True): "\u2500",
-            BarrierPoint(above=True, below=True, left=True): "\u2524",
-            BarrierPoint(above=True, below=True, right=True): "\u251C",
-            BarrierPoint(above=True, left=True, right=True): "\u2534",
-            BarrierPoint(below=True, left=True, right=True): "\u252C",
-            BarrierPoint(above=True, below=True, left=True, right=True): "\u253C",
-        }
-        return barrier_glyphs[barrier] + ("\u2500" if barrier.right else " ")
+        return _BARRIER_GLYPH_TABLE[_barrier_index(barrier)] + (
+            "\u2500" if barrier.right else " "
+        )
 
     def _render_character(self, character: Optional[Character]) -> str:
         if not character:
             return ". "
-
-        character_strings = {
-            LifeState.LIVING: "\U0001F9D1 ",
-            LifeState.UNDEAD: "\U0001F9DF ",
-            LifeState.DEAD: "\U0001F480 ",
-        }
-        return character_strings[character.life_state]
+        return _CHARACTER_GLYPHS[character.life_state]
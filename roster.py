@@ -1,5 +1,4 @@
 import attr
-from collections import Counter
 from itertools import chain
 import math
 from typing import (
@@ -96,6 +95,9 @@ class Roster(Generic[CharacterType, PartitionKeyType]):
     def characters_in(self, area: Area) -> Set[Match[CharacterType]]:
         return {Match(i.point, i.value) for i in self._positions.items_in(area)}
 
+    def positions_in(self, area: Area) -> Iterable[Point]:
+        return self._positions.points_in(area)
+
     def nearest_to(
         self,
         origin: Point,
@@ -139,7 +141,11 @@ class Roster(Generic[CharacterType, PartitionKeyType]):
         new_character = change(old_character)
         positions = self._positions.unset(position).set(position, new_character)
 
-        new_characters = self._characters - set([old_character]) | set([new_character])
+        # Copy the set of characters once and update the copy, rather than building
+        # one new set without the old character and another with the new one
+        new_characters = set(self._characters)
+        new_characters.discard(old_character)
+        new_characters.add(new_character)
 
         return Roster(area=self._area, characters=new_characters, positions=positions)
 
@@ -171,14 +177,13 @@ class Viewpoint(Generic[PartitionKeyType]):
         self._barriers = barriers
 
     def occupied_points_in(self, box: BoundingBox) -> Set[Vector]:
-        area = box.to_area(self._origin)
-        occupied_by_character = {
-            m.position - self._origin for m in self._roster.characters_in(area)
-        }
-        occupied_by_barrier = {
-            p - self._origin for p in self._barriers.occupied_points_in(area)
-        }
-        return occupied_by_character | occupied_by_barrier
+        origin = self._origin
+        area = box.to_area(origin)
+        # Build up a single set, rather than one for characters and another for
+        # barriers that then get copied into a third
+        occupied = {p - origin for p in self._roster.positions_in(area)}
+        occupied.update(p - origin for p in self._barriers.occupied_points_in(area))
+        return occupied
 
     def nearest_to(self, vector: Vector, key: PartitionKeyType) -> Optional[Vector]:
         nearest = self._roster.nearest_to(self._origin + vector, key=key)
@@ -223,8 +228,6 @@ class ChangeCharacter(Generic[CharacterType]):
         if self._instigator not in roster:
             raise ValueError(f"Action by non-existent character {self._instigator}")
 
-        character = roster.character_at(self._position)
-        if character is None:
-            raise ValueError(f"Action on non-existent character at {self._position}")
-
+        # There's no need to look up the target first: change_character raises its own
+        # ValueError if there's no character there
         return roster.change_character(self._position, self._change)
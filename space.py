@@ -1,14 +1,50 @@
 import attr
+from functools import lru_cache, total_ordering
 import math
-from typing import ClassVar, Iterator
+from typing import ClassVar, Dict, Iterator, Tuple
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@total_ordering
+@attr.s(auto_attribs=True, frozen=True, init=False, eq=False, slots=True)
 class Point:
 
     x: int
     y: int
 
+    # As with Vector, the hash comes from the co-ordinates rather than the object's
+    # address, so that sets of points iterate in the same order on every run
+    _hash: int = attr.ib(repr=False)
+
+    _instances: ClassVar[Dict[Tuple[int, int], "Point"]] = {}
+
+    def __new__(cls, x: int, y: int) -> "Point":
+        """Return the one Point at these co-ordinates, creating it if need be.
+
+        Points are shared in the same way as vectors, and for the same reason: they're
+        used as keys all over the place, so comparing them by identity, with a hash
+        cached from the co-ordinates, makes every lookup cheaper.
+        """
+        try:
+            return cls._instances[(x, y)]
+        except KeyError:
+            point = cls._instances[(x, y)] = super().__new__(cls)
+            object.__setattr__(point, "x", x)
+            object.__setattr__(point, "y", y)
+            object.__setattr__(point, "_hash", hash((x, y)))
+            return point
+
+    def __getnewargs__(self) -> Tuple[int, int]:
+        # Copying or unpickling goes back through __new__, so it finds the same instance
+        return (self.x, self.y)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Point):
+            return NotImplemented
+        return (self.x, self.y) < (other.x, other.y)
+
     def __add__(self, vector: "Vector") -> "Point":
         return Point(self.x + vector.dx, self.y + vector.dy)
 
@@ -38,13 +74,14 @@ class Area:
     def height(self) -> int:
         return self._upper.y - self._lower.y
 
-    def distance_from(self, point: Point) -> float:
+    def distance_squared_from(self, point: Point) -> int:
         x = min(point.x, self._upper.x)
         x = max(x, self._lower.x)
         y = min(point.y, self._upper.y)
         y = max(y, self._lower.y)
-        best_point = Point(x, y)
-        return (best_point - point).distance
+        dx = x - point.x
+        dy = y - point.y
+        return dx * dx + dy * dy
 
     def __iter__(self) -> Iterator[Point]:
         for y in range(self._lower.y, self._upper.y):
@@ -75,20 +112,66 @@ class Area:
         return BoundingBox(self._lower - origin, self._upper - origin)
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@total_ordering
+@attr.s(auto_attribs=True, frozen=True, init=False, eq=False, slots=True)
 class Vector:
 
     dx: int
     dy: int
 
+    # The square of this vector's length. This puts vectors in the same order as
+    # `distance`, but stays in whole numbers, so it's cheaper and exact when we only
+    # need to compare lengths. There's only ever one Vector for any pair of
+    # co-ordinates, so we work it out up front rather than every time it's asked for.
+    distance_squared: int = attr.ib(repr=False)
+
+    # Equality is by identity, but the hash comes from the co-ordinates rather than
+    # the object's address, so that sets of vectors iterate in the same order from one
+    # run to the next and a seeded simulation plays out the same way every time
+    _hash: int = attr.ib(repr=False)
+
     ZERO: ClassVar["Vector"]
 
+    _instances: ClassVar[Dict[Tuple[int, int], "Vector"]] = {}
+
+    def __new__(cls, dx: int, dy: int) -> "Vector":
+        """Return the one Vector with these co-ordinates, creating it if need be.
+
+        The same handful of vectors (moves, and offsets to nearby characters) get built
+        over and over again. Sharing them saves allocating new ones, and because there's
+        only ever one Vector for any pair of co-ordinates, equality can be a plain
+        identity check rather than comparing fields. The hash is worked out from the
+        co-ordinates once, when the Vector is created, and cached from then on.
+        """
+        try:
+            return cls._instances[(dx, dy)]
+        except KeyError:
+            vector = cls._instances[(dx, dy)] = super().__new__(cls)
+            object.__setattr__(vector, "dx", dx)
+            object.__setattr__(vector, "dy", dy)
+            object.__setattr__(vector, "distance_squared", dx * dx + dy * dy)
+            object.__setattr__(vector, "_hash", hash((dx, dy)))
+            return vector
+
+    def __getnewargs__(self) -> Tuple[int, int]:
+        # Copying or unpickling goes back through __new__, so it finds the same instance
+        return (self.dx, self.dy)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Vector):
+            return NotImplemented
+        return (self.dx, self.dy) < (other.dx, other.dy)
+
     @property
     def distance(self) -> float:
-        return math.sqrt(self.dx ** 2 + self.dy ** 2)
+        return math.sqrt(self.distance_squared)
 
     def __bool__(self) -> bool:
-        return bool(self.distance)
+        # Vectors are interned, so the zero vector is always this one instance
+        return self is not Vector.ZERO
 
     def __add__(self, other: "Vector") -> "Vector":
         return Vector(self.dx + other.dx, self.dy + other.dy)
@@ -106,6 +189,7 @@ class BoundingBox:
     _upper: Vector
 
     @classmethod
+    @lru_cache(maxsize=None)
     def range(cls, radius: int) -> "BoundingBox":
         if radius < 0:
             raise ValueError(f"Cannot have a negative range {radius}")
@@ -122,6 +206,15 @@ class BoundingBox:
                 yield Vector(dx, dy)
 
     def intersect(self, other: "BoundingBox") -> "BoundingBox":
+        # Most characters are nowhere near the edge of the world, so their range of
+        # movement usually fits inside the limits as it is
+        if (
+            other._lower.dx <= self._lower.dx
+            and other._lower.dy <= self._lower.dy
+            and self._upper.dx <= other._upper.dx
+            and self._upper.dy <= other._upper.dy
+        ):
+            return self
         return BoundingBox(
             Vector(
                 max(self._lower.dx, other._lower.dx),
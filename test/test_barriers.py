@@ -3,7 +3,7 @@ from typing import FrozenSet, Iterable
 from hypothesis import assume, given, settings
 from hypothesis import strategies as st
 
-from barriers import Barriers
+from barriers import Barriers, random_barriers
 from space import Area, Point
 
 
@@ -86,3 +86,33 @@ class TestBarriers:
         positions = {point for (point, _) in barriers.positions}
 
         assert positions == all_points_in(barrier_areas)
+
+    @given(barrier_areas=st.sets(areas(max_modulus=10), max_size=5))
+    @settings(max_examples=25)
+    def test_position_neighbours(self, barrier_areas):
+        barriers = Barriers.for_areas(barrier_areas)
+        for point, barrier_point in barriers.positions:
+            assert barrier_point.above == barriers.occupied(Point(point.x, point.y - 1))
+            assert barrier_point.below == barriers.occupied(Point(point.x, point.y + 1))
+            assert barrier_point.left == barriers.occupied(Point(point.x - 1, point.y))
+            assert barrier_point.right == barriers.occupied(Point(point.x + 1, point.y))
+
+    @given(barrier_areas=st.sets(areas(), max_size=20), area=areas())
+    @settings(max_examples=25)
+    def test_all_occupied_points_found(self, barrier_areas, area):
+        barriers = Barriers.for_areas(barrier_areas)
+        expected = {p for p in all_points_in(barrier_areas) if p in area}
+        assert barriers.occupied_points_in(area) == expected
+
+
+class TestRandomBarriers:
+    @given(area=areas(min_width=1, min_height=1), count=st.integers(0, 20))
+    @settings(max_examples=25)
+    def test_barriers_in_area(self, area, count):
+        barriers = random_barriers(range(count), area)
+
+        assert len(barriers.areas) <= count
+        for barrier in barriers.areas:
+            assert barrier.width == 1 or barrier.height == 1
+        for point in barriers.points:
+            assert point in area
@@ -34,6 +34,14 @@ class FakeViewpoint:
         return {pos for pos, char in self._positions if pos in box}
 
 
+class CountingViewpoint(FakeViewpoint):
+    searches = 0
+
+    def nearest_to(self, vector, life_state):
+        self.searches += 1
+        return super().nearest_to(vector, life_state)
+
+
 def vectors(max_offset=None):
     if max_offset is not None:
         coordinates = st.integers(min_value=-max_offset, max_value=max_offset)
@@ -109,6 +117,14 @@ class TestTargetVectors:
     def test_no_humans(self, environment):
         assert TargetVectors(FakeViewpoint(environment)).nearest_human is None
 
+    def test_repeated_lookups_search_once(self):
+        viewpoint = CountingViewpoint([(Vector(2, 2), default_human())])
+        target_vectors = TargetVectors(viewpoint)
+
+        assert target_vectors.nearest_human == Vector(2, 2)
+        assert target_vectors.nearest_human == Vector(2, 2)
+        assert viewpoint.searches == 1
+
 
 class TestLivingState:
     def test_life_state(self):
@@ -118,7 +134,7 @@ class TestLivingState:
     def test_movement_without_zombies(self, moves):
         target_vectors = TargetVectors(FakeViewpoint([]))
         assert Living().best_move(target_vectors, moves) == min(
-            moves, key=lambda v: v.distance
+            moves, key=lambda v: v.distance_squared
         )
 
     @given(
@@ -193,6 +209,9 @@ class TestDeadState:
     def test_next_state_ages(self):
         assert Dead(age=2).next_state == Dead(age=3)
 
+    def test_next_state_shared(self):
+        assert Dead(age=2).next_state is Dead(age=2).next_state
+
     def test_next_state_reanimates(self):
         assert Dead(age=20).next_state == Undead()
 
@@ -210,7 +229,7 @@ class TestUndeadState:
     def test_movement_without_humans(self, moves):
         target_vectors = TargetsForUndead(nearest_human=None)
         assert Undead().best_move(target_vectors, moves) == min(
-            moves, key=lambda v: v.distance
+            moves, key=lambda v: v.distance_squared
         )
 
     @given(human=vectors(), moves=st.lists(vectors(), min_size=1))
@@ -277,6 +296,22 @@ class TestCharacter:
         )
         assert next_action == Move(Vector(1, 1))
 
+    def test_move_action_from_occupied_position(self):
+        character = Character(state=Undead())
+        environment = FakeViewpoint(
+            [(Vector.ZERO, character), (Vector(3, 3), default_human())]
+        )
+        next_action = character.next_action(
+            environment, BoundingBox.range(5), FakeActions()
+        )
+        assert next_action == Move(Vector(1, 1))
+
+    def test_move_action_searches_once(self):
+        character = Character(state=Undead())
+        environment = CountingViewpoint([(Vector(3, 3), default_human())])
+        character.next_action(environment, BoundingBox.range(5), FakeActions())
+        assert environment.searches == 1
+
     def test_attack_action(self):
         character = Character(state=Undead())
         target = default_human()
@@ -473,9 +508,17 @@ class TestHuman:
         limits = BoundingBox(Vector(-100, -100), Vector(100, 100))
         assert human.move(environment, limits) == Vector.ZERO
 
+    def test_move_without_zero_in_range(self, human):
+        limits = BoundingBox(Vector(1, 1), Vector(3, 3))
+        with pytest.raises(ValueError):
+            human.move(FakeViewpoint([]), limits)
+
     def test_attacked_human_is_dead(self, human):
         assert human.attacked().life_state == LifeState.DEAD
 
+    def test_attacked_human_shares_dead_state(self, human):
+        assert human.attacked()._state is Dead._by_age[0]
+
     @given(environments(), containing_boxes)
     def test_dead_humans_stay_still(self, environment, limits):
         human = Character(state=Dead())
@@ -526,6 +569,10 @@ class TestAvailableMoves:
         with pytest.raises(ValueError):
             available_moves(character_range, obstacles)
 
+    def test_zero_vector_out_of_range(self):
+        with pytest.raises(ValueError):
+            available_moves(BoundingBox(Vector(1, 1), Vector(3, 3)), set())
+
     @given(
         character_ranges().flatmap(lambda b: st.tuples(st.just(b), vectors_in_box(b)))
     )
@@ -554,3 +601,25 @@ class TestAvailableMoves:
         obstacles = {Vector(1, 1), Vector(1, 0)}
         available = available_moves(character_range, obstacles)
         assert available == {Vector(0, 0), Vector(0, 1), Vector(0, 2), Vector(1, 2)}
+
+    @given(
+        character_ranges().flatmap(lambda b: st.tuples(st.just(b), vectors_in_box(b)))
+    )
+    def test_matches_ring_by_ring_search(self, range_and_obstacles):
+        character_range, obstacles = range_and_obstacles
+        assume(Vector.ZERO not in obstacles)
+
+        def offset(move):
+            return max(abs(move.dx), abs(move.dy))
+
+        expected = {Vector.ZERO}
+        for ring in range(1, max(offset(move) for move in character_range) + 1):
+            expected |= {
+                move
+                for move in character_range
+                if offset(move) == ring
+                and move not in obstacles
+                and any(offset(move - inner) <= 1 for inner in expected)
+            }
+
+        assert available_moves(character_range, obstacles) == expected
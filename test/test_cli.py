@@ -3,7 +3,7 @@ from unittest import mock
 
 import pytest
 
-from cli import each_interval, get_world_size
+from cli import each_interval, get_world_size, redraw
 
 
 @attr.s(auto_attribs=True, frozen=True)
@@ -41,7 +41,9 @@ def test_default_world_size():
     assert not auto
 
 
-@pytest.mark.parametrize("bad_size", ["12", "really big", "infxinf", "10.x6"])
+@pytest.mark.parametrize(
+    "bad_size", ["12", "really big", "infxinf", "10.x6", "10x", "x6", "10x6x2"]
+)
 def test_malformed_size(bad_size):
     with pytest.raises(ValueError):
         get_world_size(bad_size, get_terminal_size=fail, default=(5, 3))
@@ -111,6 +113,19 @@ class TestEachInterval:
 
         sleep_mock.assert_has_calls([mock.call(0), mock.call(1)])
 
+    def test_spins_for_end_of_interval(self, sleep_mock):
+        times = iter([1, 1, 1.5, 1.7, 2, 2])
+
+        gen = each_interval(
+            1, current_time=lambda: next(times), sleep=sleep_mock, spin=0.25
+        )
+
+        next(gen)
+        next(gen)
+
+        sleep_mock.assert_called_once_with(0.75)
+        assert list(times) == []
+
     @pytest.fixture
     def sleep_mock(self):
         return mock.Mock(spec_set=[])
@@ -125,3 +140,18 @@ class FakeTime:
 
     def set(self, value):
         self._value = value
+
+
+class TestRedraw:
+    def test_first_frame_clears_and_draws_everything(self):
+        assert redraw(None, ["ab", "cd"]) == "\033[H\033[Jab\ncd\n"
+
+    def test_unchanged_frame(self):
+        assert redraw(["ab", "cd"], ["ab", "cd"]) == ""
+
+    def test_only_changed_lines_redrawn(self):
+        output = redraw(["ab", "cd", "ef"], ["ab", "xy", "ef"])
+        assert output == "\033[2;1Hxy\033[K\033[4;1H"
+
+    def test_resized_frame_redraws_everything(self):
+        assert redraw(["ab"], ["ab", "cd"]) == "\033[H\033[Jab\ncd\n"
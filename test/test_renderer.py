@@ -1,8 +1,9 @@
 import attr
 
+from barriers import Barriers
 from character import LifeState
 from renderer import Renderer, RenderEmpty
-from space import Point
+from space import Area, Point
 
 
 @attr.s(frozen=True)
@@ -59,3 +60,17 @@ class TestRenderer:
         world = World(width=3, height=1, positions=[(Point(1, 0), zombie)])
         renderer = Renderer(world)
         assert renderer.lines == [". \U0001F9DF . "]
+
+    def test_barrier(self):
+        world = World(width=3, height=1, positions=[])
+        barriers = Barriers.for_areas([Area(Point(0, 0), Point(2, 1))])
+        renderer = Renderer(world, barriers)
+        assert renderer.lines == ["\u2576\u2500\u2574 . "]
+
+    def test_with_world(self):
+        barriers = Barriers.for_areas([Area(Point(0, 0), Point(1, 1))])
+        renderer = Renderer(World(width=3, height=1, positions=[]), barriers)
+
+        zombie = Character(LifeState.UNDEAD)
+        world = World(width=3, height=1, positions=[(Point(2, 0), zombie)])
+        assert renderer.with_world(world).lines == Renderer(world, barriers).lines
@@ -1,5 +1,7 @@
+import copy
 from functools import reduce
 import math
+import pickle
 
 from hypothesis import assume, example, given
 from hypothesis import strategies as st
@@ -168,6 +170,26 @@ class TestPoint:
     def test_point_equality(self, point):
         assert point == point
 
+    def test_interned(self):
+        assert Point(2, 5) is Point(x=2, y=5)
+
+    @given(st.integers(), st.integers())
+    def test_hash_from_coordinates(self, x, y):
+        assert hash(Point(x, y)) == hash((x, y))
+
+    @given(points())
+    def test_copy_and_pickle(self, point):
+        assert copy.copy(point) is point
+        assert copy.deepcopy(point) is point
+        assert pickle.loads(pickle.dumps(point)) is point
+
+    def test_ordering(self):
+        assert sorted([Point(1, 0), Point(0, 2), Point(0, 1)]) == [
+            Point(0, 1),
+            Point(0, 2),
+            Point(1, 0),
+        ]
+
     @given(points(), vectors())
     def test_addition_then_subtraction(self, point, vector):
         assert point + vector - point == vector
@@ -328,6 +350,10 @@ class TestVector:
     def test_non_zero_distance(self, dx, dy):
         assert Vector(dx, dy).distance == math.sqrt(5)
 
+    @given(vectors(bound=10000))
+    def test_distance_squared(self, vector):
+        assert vector.distance_squared == approx(vector.distance ** 2)
+
     @given(vectors(), vectors())
     @example(Vector(1, 1), Vector(3, 3))
     def test_triangle_inequality(self, a, b):
@@ -339,6 +365,27 @@ class TestVector:
     def test_value_equality(self):
         assert Vector(2, 5) == Vector(2, 5)
 
+    def test_interned(self):
+        assert Vector(2, 5) is Vector(dx=2, dy=5)
+        assert Vector(0, 0) is Vector.ZERO
+
+    @given(st.integers(), st.integers())
+    def test_hash_from_coordinates(self, dx, dy):
+        # Hashing by co-ordinates rather than identity keeps set ordering, and so the
+        # whole simulation, the same from one run to the next
+        assert hash(Vector(dx, dy)) == hash((dx, dy))
+
+    @given(vectors())
+    def test_copy_and_pickle(self, vector):
+        assert copy.copy(vector) is vector
+        assert copy.deepcopy(vector) is vector
+        assert pickle.loads(pickle.dumps(vector)) is vector
+
+    def test_ordering(self):
+        assert Vector(1, 2) < Vector(2, 3)
+        assert Vector(1, 2) <= Vector(1, 2)
+        assert Vector(0, 5) > Vector(0, 4)
+
     def test_value_inequality(self):
         assert Vector(2, 5) != Vector(2, 3)
 
@@ -407,6 +454,11 @@ class TestBoundingBox:
         intersection = reduce(lambda a, b: a.intersect(b), boxes)
         assert vector in intersection
 
+    @given(st.integers(min_value=0), st.integers(min_value=0))
+    def test_intersect_containing_box(self, radius, margin):
+        box = BoundingBox.range(radius)
+        assert box.intersect(BoundingBox.range(radius + margin)) == box
+
     @given(st.integers(min_value=0), vectors())
     @example(radius=10, vector=Vector(10, 10))
     @example(radius=0, vector=Vector(0, 0))
@@ -420,3 +472,6 @@ class TestBoundingBox:
     def test_invalid_range(self):
         with pytest.raises(ValueError):
             BoundingBox.range(-1)
+
+    def test_range_is_shared(self):
+        assert BoundingBox.range(2) is BoundingBox.range(2)
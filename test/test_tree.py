@@ -109,6 +109,28 @@ def test_nearest(area_and_points):
             assert (best_match.point - origin).distance <= (point - origin).distance
 
 
+@given(areas().flatmap(lambda a: st.tuples(st.just(a), st.lists(points_in(a)))))
+def test_build_matches_set(area_and_points):
+    area, points = area_and_points
+    positions = {point: object() for point in points}
+
+    tree: SpaceTree[object] = SpaceTree.build(area, None)
+    for point, value in positions.items():
+        tree = tree.set(point, value)
+
+    assert SpaceTree.build(area, positions) == tree
+
+
+def test_build_copies_positions():
+    positions = {Point(1, 1): "a"}
+    tree = SpaceTree.build(Area.from_zero(5, 5), positions)
+
+    positions[Point(2, 2)] = "b"
+
+    assert len(tree) == 1
+    assert Point(2, 2) not in tree
+
+
 @given(
     areas().flatmap(lambda a: st.tuples(st.just(a), st.lists(points_in(a)))), areas()
 )
@@ -131,6 +153,19 @@ def test_items_in(area_and_points, inclusion_area):
             assert Match(point, character) not in matches_in_area
 
 
+@given(
+    areas().flatmap(lambda a: st.tuples(st.just(a), st.lists(points_in(a)))), areas()
+)
+def test_points_in(area_and_points, inclusion_area):
+    tree_area, points = area_and_points
+    tree = SpaceTree.build(area=tree_area, positions={p: object() for p in points})
+
+    points_in_area = list(tree.points_in(inclusion_area))
+
+    assert len(points_in_area) == len(set(points_in_area))
+    assert set(points_in_area) == {p for p in points if p in inclusion_area}
+
+
 @given(areas().flatmap(lambda a: st.tuples(st.just(a), points_in(a))))
 def test_empty_partition_tree_item(area_and_point):
     area, point = area_and_point
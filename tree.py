@@ -78,6 +78,9 @@ class PartitionTree(Generic[PartitionKeyType, ValueType]):
             matches |= tree.items_in(area)
         return matches
 
+    def points_in(self, area: Area) -> Iterable[Point]:
+        return chain.from_iterable(t.points_in(area) for t in self._trees.values())
+
     def nearest_to(
         self,
         origin: Point,
@@ -135,12 +138,11 @@ class SpaceTree(Generic[ValueType]):
         self, area: Area, positions: Optional[Dict[Point, ValueType]] = None
     ) -> "SpaceTree[ValueType]":
         """Build and return a new SpaceTree with the given area and entries."""
-        tree: "SpaceTree[ValueType]" = SpaceTree(area, Leaf(area))
-        if positions:
-            for point, value in positions.items():
-                tree = tree.set(point, value)
-
-        return tree
+        # Splitting the entries up front gives the same tree as setting them one at a
+        # time, without copying leaves and paths for every entry along the way. We take
+        # our own copy of the entries, so that changing the caller's dict afterwards
+        # can't change the tree.
+        return SpaceTree(area, _build_node(area, dict(positions or {})))
 
     def __init__(self, area: Area, root: "Node[ValueType]"):
         self._area = area
@@ -197,6 +199,13 @@ class SpaceTree(Generic[ValueType]):
     def items_in(self, area: Area) -> Set[Match[ValueType]]:
         return set(self._root.items_in(area))
 
+    def points_in(self, area: Area) -> Iterable[Point]:
+        """Return the points of all entries in the given area.
+
+        When only the points are needed, this saves building a Match for each entry.
+        """
+        return self._root.points_in(area)
+
 
 class Leaf(Generic[ValueType]):
     """Helper class for SpaceTree, representing a node that hasn't been split."""
@@ -231,6 +240,11 @@ class Leaf(Generic[ValueType]):
             Match(pos, item) for pos, item in self._positions.items() if pos in area
         )
 
+    def points_in(self, area: Area) -> Iterable[Point]:
+        if not self._positions or not self._area.intersects_with(area):
+            return []
+        return [pos for pos in self._positions if pos in area]
+
     def _split(self) -> Tuple[Area, Area, LowerFunc]:
         if self._area.width >= self._area.height:
             # Split horizontally
@@ -277,23 +291,51 @@ class Leaf(Generic[ValueType]):
     def nearest_to(
         self,
         origin: Point,
-        max_distance: float = math.inf,
+        max_distance_squared: float = math.inf,
     ) -> Optional[Match[ValueType]]:
 
-        if self._area.distance_from(origin) > max_distance:
+        if (
+            not self._positions
+            or self._area.distance_squared_from(origin) > max_distance_squared
+        ):
             return None
 
+        # Working from plain co-ordinates saves building a Vector for every position
+        origin_x, origin_y = origin.x, origin.y
+
         best_match = None
         for pos, value in self._positions.items():
-            if pos == origin:
-                continue
-            distance = (pos - origin).distance
-            if distance < max_distance:
-                max_distance = distance
+            dx = pos.x - origin_x
+            dy = pos.y - origin_y
+            distance_squared = dx * dx + dy * dy
+            if 0 < distance_squared < max_distance_squared:
+                max_distance_squared = distance_squared
                 best_match = Match(pos, value)
         return best_match
 
 
+def _build_node(area: Area, positions: Dict[Point, ValueType]) -> "Node[ValueType]":
+    leaf = Leaf(area, positions)
+    if len(positions) <= Leaf.LEAF_MAX:
+        return leaf
+
+    lower_area, upper_area, lower_func = leaf._split()
+    lower_positions = {}
+    upper_positions = {}
+    for point, value in positions.items():
+        if lower_func(point):
+            lower_positions[point] = value
+        else:
+            upper_positions[point] = value
+
+    return SplitNode(
+        area,
+        lower_func,
+        _build_node(lower_area, lower_positions),
+        _build_node(upper_area, upper_positions),
+    )
+
+
 class SplitNode(Generic[ValueType]):
     """Helper class for SpaceTree, representing a node that has been split into two."""
 
@@ -308,6 +350,9 @@ class SplitNode(Generic[ValueType]):
         self._lower_func = lower_func
         self._lower_child = lower_child
         self._upper_child = upper_child
+        # Nodes never change once they're built, so keep hold of the size rather than
+        # counting through the whole subtree whenever an update needs to know it
+        self._size = len(lower_child) + len(upper_child)
 
     def __getitem__(self, point: Point) -> ValueType:
         if self._lower_func(point):
@@ -316,7 +361,7 @@ class SplitNode(Generic[ValueType]):
             return self._upper_child[point]
 
     def __len__(self) -> int:
-        return len(self._lower_child) + len(self._upper_child)
+        return self._size
 
     def __hash__(self) -> int:
         return hash((self._lower_child, self._upper_child))
@@ -325,6 +370,11 @@ class SplitNode(Generic[ValueType]):
         if not isinstance(other, SplitNode):
             return False
 
+        # Trees share any subtrees that haven't changed, so comparing two versions of
+        # the same tree can skip everything except the path to each change
+        if other is self:
+            return True
+
         return (
             self._lower_child == other._lower_child
             and self._upper_child == other._upper_child
@@ -338,6 +388,13 @@ class SplitNode(Generic[ValueType]):
             return []
         return chain(self._lower_child.items_in(area), self._upper_child.items_in(area))
 
+    def points_in(self, area: Area) -> Iterable[Point]:
+        if not self._area.intersects_with(area):
+            return []
+        return chain(
+            self._lower_child.points_in(area), self._upper_child.points_in(area)
+        )
+
     def set(self, point: Point, value: ValueType) -> "SplitNode[ValueType]":
         if self._lower_func(point):
             return SplitNode(
@@ -373,25 +430,27 @@ class SplitNode(Generic[ValueType]):
     def nearest_to(
         self,
         origin: Point,
-        max_distance: float = math.inf,
+        max_distance_squared: float = math.inf,
     ) -> Optional[Match[ValueType]]:
 
-        if self._area.distance_from(origin) > max_distance:
+        if self._area.distance_squared_from(origin) > max_distance_squared:
             return None
 
+        # Search the side the origin is on first: anything we find there lets us rule
+        # out more of the other side without visiting it
         if self._lower_func(origin):
-            children = [self._lower_child, self._upper_child]
+            near_child, far_child = self._lower_child, self._upper_child
         else:
-            children = [self._upper_child, self._lower_child]
+            near_child, far_child = self._upper_child, self._lower_child
 
-        best_match = None
-        for child in children:
-            child_match = child.nearest_to(origin, max_distance)
-            if child_match is not None:
-                best_match = child_match
-                max_distance = (child_match.point - origin).distance
+        best_match = near_child.nearest_to(origin, max_distance_squared)
+        if best_match is not None:
+            dx = best_match.point.x - origin.x
+            dy = best_match.point.y - origin.y
+            max_distance_squared = dx * dx + dy * dy
 
-        return best_match
+        far_match = far_child.nearest_to(origin, max_distance_squared)
+        return far_match if far_match is not None else best_match
 
 
 Node = Union[Leaf[ValueType], SplitNode[ValueType]]